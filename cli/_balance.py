@@ -1,7 +1,5 @@
 import typer
 
-from core.block import Block
-from core.helpers import BlockchainHelper
 from ._app import app
 from ._helper import CLIHelper
 
@@ -14,6 +12,10 @@ def balance(
     Show the cumulative amount and list of UTXOs belonging to ADDRESS.
     """
 
+    # Import the blockchain core lazily to keep CLI startup fast
+    from core.block import Block
+    from core.helpers import BlockchainHelper
+
     # Parse command arguments
     wallet = CLIHelper.load_wallet_by_address(address)
 
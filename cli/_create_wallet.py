@@ -1,4 +1,3 @@
-from core.wallet import Wallet
 from ._app import app
 
 
@@ -8,6 +7,9 @@ def create_wallet() -> None:
     Create new wallet and save it into the registry.
     """
 
+    # Import the blockchain core lazily to keep CLI startup fast
+    from core.wallet import Wallet
+
     # Create new wallet
     print(f'Creating new wallet...')
 
@@ -1,4 +1,9 @@
-from core.wallet import Wallet
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.wallet import Wallet
 
 
 class CLIHelper:
@@ -11,6 +16,8 @@ class CLIHelper:
         :return: the loaded wallet
         """
 
+        from core.wallet import Wallet
+
         assert isinstance(address, str), \
             'Argument `address` has to be of type str.'
 
@@ -1,8 +1,5 @@
 import typer
 
-from core.block import Block
-from core.helpers import BlockchainHelper, TransactionHelper
-from core.transaction import Transaction
 from ._app import app
 from ._helper import CLIHelper
 
@@ -15,6 +12,10 @@ def mine(
     Mine new block and add it to the blockchain. Coinbase transaction is awarded to ADDRESS.
     """
 
+    # Import the blockchain core lazily to keep CLI startup fast
+    from core.block import Block
+    from core.helpers import BlockchainHelper, TransactionHelper
+
     # Parse command arguments
     wallet = CLIHelper.load_wallet_by_address(address)
 
@@ -28,8 +29,9 @@ def mine(
 
     # Check if able to mine block
     if isinstance(mined_block, Block):
-        # Save the blockchain
-        BlockchainHelper.save_blockchain(mined_block)
+        # Save the blockchain; the store already holds the chain the new block extends,
+        # so only the mined block itself has to be appended
+        BlockchainHelper.append_block(mined_block)
         BlockchainHelper.export_blockchain(mined_block)
 
         # Remove processed transactions from mempool
@@ -43,7 +45,7 @@ def mine(
         print(f'├ Nonce: {mined_block.nonce}')
         print(f'├ Timestamp: {mined_block.timestamp}')
         print(f'├ Transactions: {len(mined_block.transactions)}')
-        print(f'├ Merkle root: {Transaction.calculate_merkle_root(mined_block.transactions).hex()}')
+        print(f'├ Merkle root: {mined_block.merkle_root().hex()}')
         print(f'└ Previous block ID: {prev_block_id}')
         return
 
@@ -2,9 +2,6 @@ from datetime import datetime
 
 import typer
 
-from core.block import Block
-from core.helpers import BlockchainHelper, TransactionHelper
-from core.transaction import TransactionInput, TransactionOutput, Transaction
 from ._app import app
 from ._helper import CLIHelper
 
@@ -19,6 +16,11 @@ def transfer(
     Transfer specified AMOUNT of units from FROM_ADDRESS to TO_ADDRESS.
     """
 
+    # Import the blockchain core lazily to keep CLI startup fast
+    from core.block import Block
+    from core.helpers import BlockchainHelper, TransactionHelper
+    from core.transaction import TransactionInput, TransactionOutput, Transaction
+
     # Parse command arguments
     if amount <= 0:
         raise ValueError('AMOUNT has to be an integer greater than zero.')
@@ -43,21 +45,21 @@ def transfer(
     if from_wallet.address() not in balances or balances[from_wallet.address()] < amount:
         raise ValueError('There are not enough funds available to execute this transaction.')
 
-    # Prepare UTXOs sorted by amount
-    unspent_outpoints = list(map(lambda op: (op[0], op[1].amount), unspent_outpoints.items()))
-
-    unspent_outpoints.sort(key=lambda item: item[1])
-    reversed(unspent_outpoints)
+    # Prepare UTXOs sorted by amount in descending order
+    # The previous ascending sort relied on pop() from the list end; the bare reversed() call it
+    # carried was dead code since its result was never used
+    unspent_outpoints = sorted(unspent_outpoints.items(), key=lambda item: item[1].amount, reverse=True)
 
-    # Combine UTXOs to fit specified amount
+    # Combine largest UTXOs first until they cover the specified amount
     prepared_amount = 0
     prepared_outpoints = []
 
-    while prepared_amount < amount:
-        outpoint = unspent_outpoints.pop()
+    for outpoint, tx_output in unspent_outpoints:
+        if prepared_amount >= amount:
+            break
 
-        prepared_amount += outpoint[1]
-        prepared_outpoints.append(outpoint[0])
+        prepared_amount += tx_output.amount
+        prepared_outpoints.append(outpoint)
 
     # Prepare the transaction inputs and outputs
     print('Creating transaction...')
@@ -1,6 +1,5 @@
 from datetime import datetime
 
-from core.helpers import TransactionHelper
 from ._app import app
 
 
@@ -10,6 +9,9 @@ def waiting_transactions() -> None:
     List waiting transactions.
     """
 
+    # Import the blockchain core lazily to keep CLI startup fast
+    from core.helpers import TransactionHelper
+
     # Load transactions from mempool and sort them by timestamps
     print(f'Loading transactions from mempool...')
 
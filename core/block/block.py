@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import struct
 from collections import defaultdict, OrderedDict
-from contextlib import suppress
 from hashlib import sha256
 from math import ceil
 from time import time
@@ -13,8 +12,21 @@ from core.helpers.bytes import BytesHelper
 if TYPE_CHECKING:
     from core.transaction import Transaction, CoinbaseTransaction, TransactionOutpoint, TransactionOutput
 
+# Precompiled layout of the 80-byte block header (previous block ID, merkle root, timestamp, nonce)
+HEADER_STRUCT = struct.Struct('>32s32sqq')
+
+# Proof-of-work target; a block ID is a valid proof when it compares below this value
+# (i.e. starts with at least two null bytes)
+PROOF_TARGET = bytes(2) + b'\xff' * 30
+
 
 class Block:
+    # Fixed attribute layout; drops the per-instance __dict__ and its lookup indirection,
+    # which adds up when whole chains are deserialized block by block
+    __slots__ = ('previous_block', 'transactions', 'timestamp', 'nonce',
+                 '_header_cache', '_id_cache', '_merkle_root', '_chain_cache',
+                 '_tx_index', '_utxo', '_utxo_by_address')
+
     def __init__(self, previous_block: Block | None, transactions: Sequence[Transaction]):
         """
         Create a new block.
@@ -28,17 +40,97 @@ class Block:
 
         assert isinstance(previous_block, Block) or isinstance(self, GenesisBlock), \
             'Argument `previous_block` has to be an instance of Block.'
-        assert isinstance(transactions, Sequence) \
-               and all(isinstance(transaction, Transaction) for transaction in transactions), \
+        assert isinstance(transactions, Sequence), \
             'Argument `transactions` has to be a sequence of valid Transaction instances.'
-        assert sum(isinstance(transaction, CoinbaseTransaction) for transaction in transactions) <= 1, \
-            'Provided transactions may include only one instance of CoinbaseTransaction.'
+
+        if __debug__:
+            # Validate the transactions in a single pass; python -O skips the whole block
+            coinbase_count = 0
+
+            for transaction in transactions:
+                assert isinstance(transaction, Transaction), \
+                    'Argument `transactions` has to be a sequence of valid Transaction instances.'
+
+                coinbase_count += isinstance(transaction, CoinbaseTransaction)
+
+            assert coinbase_count <= 1, \
+                'Provided transactions may include only one instance of CoinbaseTransaction.'
 
         self.previous_block = previous_block
-        self.transactions = tuple(transactions)
+        self.transactions = transactions if type(transactions) is tuple else tuple(transactions)
         self.timestamp = ceil(time() * 1000)
         self.nonce = 0
 
+        # Memoized header and ID, each stored together with the (timestamp, nonce) pair they were
+        # computed for so direct mutation of either field invalidates them
+        self._header_cache: Tuple[int, int, bytes] | None = None
+        self._id_cache: Tuple[int, int, bytes] | None = None
+
+        # Memoized merkle root; the transactions tuple never changes after construction
+        self._merkle_root: bytes | None = None
+
+        # Memoized expanded chain stored with the (timestamp, nonce) pair it was keyed under;
+        # the previous_block links never change after construction, but this block's own ID
+        # (the last key) does whenever either field is mutated
+        self._chain_cache: Tuple[int, int, OrderedDict[bytes, Block]] | None = None
+
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """
+        Build the transaction index and unspent outpoint snapshot of the blockchain up to this block.
+
+        Both indexes are created as copies of the previous block's indexes with this block's transactions
+        applied on top, so every block shares the traversal cost of its ancestors instead of re-walking
+        the whole chain on every query.
+        """
+
+        from core.transaction import TransactionOutpoint
+
+        if isinstance(self.previous_block, Block):
+            self._tx_index = dict(self.previous_block._tx_index)
+            self._utxo = dict(self.previous_block._utxo)
+            self._utxo_by_address = dict(self.previous_block._utxo_by_address)
+        else:
+            self._tx_index = {}
+            self._utxo = {}
+            self._utxo_by_address = {}
+
+        # Addresses whose buckets were already copied, so shared buckets are never mutated in place
+        touched_addresses = set()
+
+        def address_bucket(address: bytes) -> Dict[TransactionOutpoint, TransactionOutput]:
+            if address not in touched_addresses:
+                self._utxo_by_address[address] = dict(self._utxo_by_address.get(address, ()))
+                touched_addresses.add(address)
+
+            return self._utxo_by_address[address]
+
+        # Bind the index structures to locals to keep attribute lookups out of the inner loops
+        tx_index = self._tx_index
+        utxo = self._utxo
+        utxo_pop = utxo.pop
+
+        # Apply this block's transactions on top of the inherited snapshot
+        for transaction in self.transactions:
+            transaction_id = transaction.id()
+            tx_index[transaction_id] = transaction
+
+            # Remove outpoints referenced by transaction's inputs from unspent outpoints
+            for tx_input in transaction.inputs:
+                outpoint = tx_input.outpoint
+                spent_output = utxo_pop(outpoint, None)
+
+                if spent_output is not None:
+                    address_bucket(spent_output.address).pop(outpoint, None)
+
+            # Add outpoints created by transaction's outputs to the unspent outpoints
+            for i, tx_output in enumerate(transaction.outputs):
+                outpoint = TransactionOutpoint(transaction_id, i)
+
+                utxo[outpoint] = tx_output
+                address_bucket(tx_output.address)[outpoint] = tx_output
+
     def __bytes__(self):
         return b''.join([
             self.block_header(),
@@ -46,10 +138,14 @@ class Block:
         ])
 
     def __eq__(self, other: Any):
-        return bytes(other) == self.__bytes__()
+        # The header commits to the transactions through the merkle root, so comparing the cached
+        # 32-byte IDs is equivalent to comparing the full serializations
+        return isinstance(other, Block) and self.id() == other.id()
 
     def __hash__(self):
-        return hash(self.__bytes__())
+        # Hashing the cached 32-byte ID instead of the full serialization keeps this consistent
+        # with the ID-based __eq__
+        return hash(self.id())
 
     def id(self) -> bytes:
         """
@@ -58,7 +154,15 @@ class Block:
         :return: the hash digest of the block header
         """
 
-        return sha256(self.block_header()).digest()
+        cache = self._id_cache
+
+        if cache is not None and cache[0] == self.timestamp and cache[1] == self.nonce:
+            return cache[2]
+
+        block_id = sha256(self.block_header()).digest()
+        self._id_cache = (self.timestamp, self.nonce, block_id)
+
+        return block_id
 
     def block_header(self) -> bytes:
         """
@@ -67,14 +171,43 @@ class Block:
         :return: the serialized block header
         """
 
+        cache = self._header_cache
+
+        if cache is not None and cache[0] == self.timestamp and cache[1] == self.nonce:
+            return cache[2]
+
+        header = self._serialize_header()
+        self._header_cache = (self.timestamp, self.nonce, header)
+
+        return header
+
+    def merkle_root(self) -> bytes:
+        """
+        Calculate the merkle root of the block's transactions.
+
+        :return: the hash digest of the merkle root
+        """
+
         from core.transaction import Transaction
 
-        return b''.join([
+        if self._merkle_root is None:
+            self._merkle_root = Transaction.calculate_merkle_root(self.transactions)
+
+        return self._merkle_root
+
+    def _serialize_header(self) -> bytes:
+        """
+        Serialize the block header.
+
+        :return: the serialized block header
+        """
+
+        return HEADER_STRUCT.pack(
             self.previous_block.id(),
-            Transaction.calculate_merkle_root(self.transactions),
-            struct.pack('>q', self.timestamp),
-            struct.pack('>q', self.nonce)
-        ])
+            self.merkle_root(),
+            self.timestamp,
+            self.nonce
+        )
 
     def json(self) -> Dict[str, Any]:
         """
@@ -83,11 +216,9 @@ class Block:
         :return: a dictionary containing all information about this block
         """
 
-        from core.transaction import Transaction
-
         return {
             'previous_block_id': self.previous_block.id().hex(),
-            'transactions_root': Transaction.calculate_merkle_root(self.transactions).hex(),
+            'transactions_root': self.merkle_root().hex(),
             'timestamp': self.timestamp,
             'nonce': self.nonce,
             'transactions': tuple(transaction.json() for transaction in self.transactions)
@@ -106,33 +237,39 @@ class Block:
         :return: a dictionary of outpoints as keys and the referenced transaction outputs as values
         """
 
-        from core.transaction import Transaction
-
-        assert addresses is None or all(isinstance(address, bytes) and len(address) == 8 for address in addresses), \
+        assert addresses is None or isinstance(addresses, Sequence), \
             'Argument `addresses` has to be a sequence of bytes[8].'
-        assert all(isinstance(tx, Transaction) for tx in additional_transactions), \
+        assert isinstance(additional_transactions, Sequence), \
             'Argument `additional_transactions` has to be a sequence of Transaction instances.'
 
         from core.transaction import TransactionOutpoint
 
-        # Get all transactions in the blockchain to this block
-        additional_transactions = dict(zip((tx.id() for tx in additional_transactions), additional_transactions))
-        transactions = self.expand_transactions() | additional_transactions
-        unspent_outpoints: Dict[TransactionOutpoint, TransactionOutput] = {}
+        # Serve address-limited queries straight from the secondary index when no overlay is requested
+        if addresses is not None and len(additional_transactions) == 0:
+            return {outpoint: tx_output
+                    for address in frozenset(addresses)
+                    for outpoint, tx_output in self._utxo_by_address.get(address, {}).items()}
+
+        # Start from the maintained snapshot and apply the out-of-block transactions on top
+        unspent_outpoints: Dict[TransactionOutpoint, TransactionOutput] = dict(self._utxo)
+        unspent_pop = unspent_outpoints.pop
+
+        for transaction in additional_transactions:
+            transaction_id = transaction.id()
 
-        # Iterate over the transactions
-        for transaction in transactions.values():
             # Remove outpoints referenced by transaction's inputs from unspent outpoints
             for tx_input in transaction.inputs:
-                # KeyErrors are going to be raised in case that 'addresses' argument is provided
-                # This function should be executed only on checked blockchain, so suppressing the exception is safe
-                with suppress(KeyError):
-                    del unspent_outpoints[tx_input.outpoint]
+                unspent_pop(tx_input.outpoint, None)
 
             # Add outpoints created by transaction's outputs to the unspent outpoints
             for i, tx_output in enumerate(transaction.outputs):
-                if addresses is None or tx_output.address in addresses:
-                    unspent_outpoints[TransactionOutpoint(transaction.id(), i)] = tx_output
+                unspent_outpoints[TransactionOutpoint(transaction_id, i)] = tx_output
+
+        # Limit the outpoints to the requested addresses
+        if addresses is not None:
+            addresses = frozenset(addresses)
+            unspent_outpoints = {outpoint: tx_output for outpoint, tx_output in unspent_outpoints.items()
+                                 if tx_output.address in addresses}
 
         return unspent_outpoints
 
@@ -167,7 +304,7 @@ class Block:
         # Iterate over blocks:
         for block in blocks:
             # Check if proof is valid
-            if block.id() >= (bytes(2) + b'\xff' * 30):
+            if block.id() >= PROOF_TARGET:
                 return False
 
         return True
@@ -189,14 +326,14 @@ class Block:
         # Expand the blockchain to check transactions per-block if needed
         blocks = (self,) if shallow else self.expand_chain().values()
 
-        # Iterate over blocks
+        # Iterate over blocks and bail out on the first invalid transaction; the cheap amount/UTXO
+        # checks inside Transaction.valid short-circuit before the signature check runs
         for block in blocks:
-            transactions = block.transactions
+            previous_block = block.previous_block
 
-            # Check if all transactions are valid
-            if any(not transaction.valid(block.previous_block, additional_transactions)
-                   for transaction in transactions):
-                return False
+            for transaction in block.transactions:
+                if not transaction.valid(previous_block, additional_transactions):
+                    return False
 
         return True
 
@@ -207,19 +344,24 @@ class Block:
         :return: a dictionary of block ids as keys and blocks as values
         """
 
-        blocks: OrderedDict[bytes, Block] = OrderedDict({
-            self.id(): self
-        })
-        block = self
+        cache = self._chain_cache
+
+        if cache is None or cache[0] != self.timestamp or cache[1] != self.nonce:
+            # Collect the blocks from this tip back to genesis
+            chain = [self]
+            block = self
+
+            while isinstance(block := block.previous_block, Block):
+                chain.append(block)
 
-        # Loop while there is a previous block
-        while isinstance(block := block.previous_block, Block):
-            blocks[block.id()] = block
+            # Key the blocks by ID in timeline order in a single pass
+            blocks: OrderedDict[bytes, Block] = OrderedDict((block.id(), block) for block in reversed(chain))
 
-        # Reverse the dictionary key order to represent timeline
-        blocks = OrderedDict(reversed(blocks.items()))
+            cache = (self.timestamp, self.nonce, blocks)
+            self._chain_cache = cache
 
-        return blocks
+        # Hand out a copy so callers cannot mutate the memoized chain
+        return OrderedDict(cache[2])
 
     def expand_transactions(self) -> Dict[bytes, Transaction]:
         """
@@ -228,14 +370,8 @@ class Block:
         :return: a dictionary of transactions ids as keys and transactions as values
         """
 
-        transactions = {}
-
-        # Iterate over all blocks and extract transactions from them
-        for block in self.expand_chain().values():
-            for transaction in block.transactions:
-                transactions[transaction.id()] = transaction
-
-        return transactions
+        # The index is maintained incrementally in chain order, so a copy is enough
+        return dict(self._tx_index)
 
     @staticmethod
     def sum_unspent_outpoints(unspent_outpoints: Dict[TransactionOutpoint, TransactionOutput]) \
@@ -247,18 +383,16 @@ class Block:
         :return: a dictionary of addresses as keys and balances as values
         """
 
-        from core.transaction import TransactionOutpoint, TransactionOutput
-
-        assert isinstance(unspent_outpoints, dict) \
-               and all(isinstance(outpoint, TransactionOutpoint) and isinstance(amount, TransactionOutput)
-                       for outpoint, amount in unspent_outpoints.items()), \
+        assert isinstance(unspent_outpoints, dict), \
             'Argument `unspent_outpoints` has to be a Dict[TransactionOutpoint, TransactionOutput].'
 
         # Initialize the balances as a dictionary with default value of 0
-        balances = defaultdict(lambda: 0.0)
+        # float is a C-level factory, so missed keys skip the Python call overhead of a lambda
+        balances = defaultdict(float)
 
-        # Iterate over the outpoints and add their values to the total balance
-        for outpoint, tx_output in unspent_outpoints.items():
+        # Iterate over the outputs and add their values to the total balance
+        # Only the outputs are needed for the aggregation, so the outpoint keys are never touched
+        for tx_output in unspent_outpoints.values():
             balances[tx_output.address] += tx_output.amount
 
         return balances
@@ -276,24 +410,23 @@ class Block:
         from core.transaction import Transaction
 
         with BytesHelper.load_safe(b):
-            # Load previous block ID
-            b, previous_block_id = BytesHelper.load_raw_data(b, 32)
+            # Load the whole header in a single unpack without slicing the tail
+            previous_block_id, merkle_root, timestamp, nonce = HEADER_STRUCT.unpack_from(b)
+            b = b[HEADER_STRUCT.size:]
 
             if previous_block_id != previous_block.id():
                 raise ValueError('Loaded previous block ID has to match provided previous block ID.')
 
-            # Load other block properties
-            b, merkle_root = BytesHelper.load_raw_data(b, 32)
-            b, timestamp = b[8:], struct.unpack('>q', b[:8])[0]
-            b, nonce = b[8:], struct.unpack('>q', b[:8])[0]
+            # Load the transactions
             b, transactions = BytesHelper.to_array(b, Transaction)
 
             if merkle_root != Transaction.calculate_merkle_root(transactions):
                 raise ValueError('Loaded merkle root has to match calculated merkle root.')
 
-        # Create the new block
+        # Create the new block; the merkle root was just verified, so seed the cache with it
         block = Block(previous_block, transactions)
         block.timestamp = timestamp
         block.nonce = nonce
+        block._merkle_root = merkle_root
 
         return b, block
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import struct
 from typing import Sequence, Dict, TYPE_CHECKING, Tuple, Any
 
-from .block import Block
+from .block import Block, HEADER_STRUCT
 from ..helpers.bytes import BytesHelper
 
 if TYPE_CHECKING:
@@ -11,24 +10,25 @@ if TYPE_CHECKING:
 
 
 class GenesisBlock(Block):
+    # All attributes live in Block's slots; an empty tuple keeps instances __dict__-free
+    __slots__ = ()
+
     def __init__(self, transactions: Sequence[Transaction]):
         super().__init__(None, transactions)
 
-    def block_header(self) -> bytes:
+    def _serialize_header(self) -> bytes:
         """
-        Get the serialized block header.
+        Serialize the block header.
 
         :return: the serialized block header
         """
 
-        from core.transaction import Transaction
-
-        return b''.join([
+        return HEADER_STRUCT.pack(
             bytes(32),
-            Transaction.calculate_merkle_root(self.transactions),
-            struct.pack('>q', self.timestamp),
-            struct.pack('>q', self.nonce)
-        ])
+            self.merkle_root(),
+            self.timestamp,
+            self.nonce
+        )
 
     def json(self) -> Dict[str, Any]:
         """
@@ -37,11 +37,9 @@ class GenesisBlock(Block):
         :return: a dictionary containing all information about this block
         """
 
-        from core.transaction import Transaction
-
         return {
             'previous_block_id': None,
-            'transactions_root': Transaction.calculate_merkle_root(self.transactions).hex(),
+            'transactions_root': self.merkle_root().hex(),
             'timestamp': self.timestamp,
             'nonce': self.nonce,
             'transactions': tuple(transaction.json() for transaction in self.transactions)
@@ -60,25 +58,24 @@ class GenesisBlock(Block):
         from core.transaction import Transaction
 
         with BytesHelper.load_safe(b):
-            # Load previous block ID
-            b, previous_block_id = BytesHelper.load_raw_data(b, 32)
+            # Load the whole header in a single unpack without slicing the tail
+            previous_block_id, merkle_root, timestamp, nonce = HEADER_STRUCT.unpack_from(b)
+            b = b[HEADER_STRUCT.size:]
 
             if previous_block_id != bytes(32):
                 raise ValueError('Loaded previous block ID of genesis block has to be empty bytes[32].')
 
-            # Load other block properties
-            b, merkle_root = BytesHelper.load_raw_data(b, 32)
-            b, timestamp = b[8:], struct.unpack('>q', b[:8])[0]
-            b, nonce = b[8:], struct.unpack('>q', b[:8])[0]
+            # Load the transactions
             b, transactions = BytesHelper.to_array(b, Transaction)
 
             if merkle_root != Transaction.calculate_merkle_root(transactions):
                 raise ValueError('Loaded merkle root has to match calculated merkle root.')
 
-        # Create the new block
+        # Create the new block; the merkle root was just verified, so seed the cache with it
         block = GenesisBlock(transactions)
         block.timestamp = timestamp
         block.nonce = nonce
+        block._merkle_root = merkle_root
 
         return b, block
 
@@ -94,6 +91,9 @@ class GenesisBlock(Block):
         assert isinstance(b, bytes), \
             'Argument `b` has to be of type bytes.'
 
+        # Wrap the data in a memoryview so advancing past each parsed block never copies the tail
+        b = memoryview(b)
+
         # Deserialize first block as a genesis block
         b, block = cls.from_bytes(b, None)
 
@@ -1,4 +1,4 @@
-from .blockchain import BlockchainHelper
 from .bytes import BytesHelper, SupportsFromBytes
 from .hash import HashHelper
+from .blockchain import BlockchainHelper
 from .transaction import TransactionHelper
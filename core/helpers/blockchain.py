@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
 from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from typing import TYPE_CHECKING
 
-from core.transaction import CoinbaseTransaction
 from core.wallet import Wallet
 
 if TYPE_CHECKING:
@@ -13,6 +13,11 @@ if TYPE_CHECKING:
 MIN_INT64 = -9_223_372_036_854_775_807
 MAX_INT64 = 9_223_372_036_854_775_807
 
+# Per-process mining state, populated once per worker by BlockchainHelper._init_nonce_worker
+# so the header prefix is not pickled and re-hashed for every submitted batch
+_nonce_worker_midstate = None
+_nonce_worker_stop = None
+
 
 class BlockchainHelper:
     @staticmethod
@@ -55,8 +60,32 @@ class BlockchainHelper:
             'Argument `latest_block` has to be an instance of Block.'
 
         # Save the serialized and expanded blockchain
+        # Blocks are written one by one so the file's own write buffer batches the I/O
+        # without first materializing the whole chain as a single bytes object
         with open('data/blockchain.bin', 'wb') as file:
-            file.write(b''.join(bytes(block) for block in latest_block.expand_chain().values()))
+            for block in latest_block.expand_chain().values():
+                file.write(bytes(block))
+
+    @staticmethod
+    def append_block(block: Block) -> None:
+        """
+        Append a single serialized block to the blockchain store.
+
+        The store has to already contain exactly the serialized chain up to the block's previous
+        block (which holds whenever the chain was loaded from the store in the same run), making
+        a save after mining O(new block) instead of re-serializing the whole chain.
+
+        :param block: the block to be appended
+        """
+
+        from core.block import Block
+
+        assert isinstance(block, Block), \
+            'Argument `block` has to be an instance of Block.'
+
+        # Append the serialized block to the store
+        with open('data/blockchain.bin', 'ab') as file:
+            file.write(bytes(block))
 
     @staticmethod
     def export_blockchain(latest_block: Block) -> None:
@@ -73,7 +102,7 @@ class BlockchainHelper:
 
         # Save the serialized and expanded blockchain
         with open('data/blockchain.json', 'w') as file:
-            json.dump(list(block.json() for block in latest_block.expand_chain().values()), file)
+            json.dump([block.json() for block in latest_block.expand_chain().values()], file)
 
     @staticmethod
     def mine_block(
@@ -94,6 +123,7 @@ class BlockchainHelper:
 
         from core.block import Block, GenesisBlock
         from core.helpers import TransactionHelper
+        from core.transaction import CoinbaseTransaction
 
         assert isinstance(latest_block, Block) or latest_block is None, \
             'Argument `latest_block` has to be an instance of Block or None.'
@@ -130,61 +160,98 @@ class BlockchainHelper:
             raise Exception('Created block does not contain valid transactions after validation.')
 
         # Declare locked values and constants
-        block_bytes = b''.join(bytes(b) for b in block.expand_chain().values())
+        # The header prefix (previous block ID, merkle root and timestamp) is constant during the search,
+        # so workers only have to append the candidate nonce and hash 80 bytes per attempt
+        header_prefix = block.block_header()[:72]
         start = 0
         pending = set()
 
+        # Workers poll this event between nonce chunks, so batches still in flight stop
+        # almost immediately once any worker has found a valid proof
+        stop_event = multiprocessing.Event()
+
         # Start mining the block
-        with ProcessPoolExecutor(processes) as executor:
+        with ProcessPoolExecutor(
+                processes,
+                initializer=BlockchainHelper._init_nonce_worker,
+                initargs=(header_prefix, stop_event)
+        ) as executor:
             # Loop and process batch sizes until nonce is found
             # Max positive int size of int[8]
-            while True and start <= MAX_INT64:
+            while start <= MAX_INT64:
                 if len(pending) >= processes:
                     done, pending = wait(pending, return_when=FIRST_COMPLETED)
 
-                    found = list(filter(lambda result: result is not None, map(lambda future: future.result(), done)))
+                    found = next((result for future in done if (result := future.result()) is not None), None)
 
-                    if len(found) > 0:
-                        block.nonce = found[0]
+                    if found is not None:
+                        # Tell the remaining workers to abandon their batches before the
+                        # executor shutdown waits for them on context exit
+                        stop_event.set()
+
+                        block.nonce = found
                         return block
 
                 pending.add(
                     executor.submit(
                         BlockchainHelper._process_nonce_batch,
-                        block_bytes,
                         start,
                         start := min(start + batch_size, MAX_INT64),
                     )
                 )
 
-            # Terminate the pool
-            executor.shutdown(wait=False, cancel_futures=True)
+    @staticmethod
+    def _init_nonce_worker(header_prefix: bytes, stop_event) -> None:
+        """
+        Initialize a mining worker process by absorbing the constant header prefix into a midstate.
+
+        :param header_prefix: the serialized block header without the trailing nonce (72 bytes)
+        :param stop_event: a multiprocessing event signalling that a valid proof was already found
+        """
+
+        global _nonce_worker_midstate, _nonce_worker_stop
+
+        from hashlib import sha256
+
+        assert isinstance(header_prefix, bytes) and len(header_prefix) == 72, \
+            'Argument `header_prefix` has to be of type bytes[72].'
+
+        _nonce_worker_midstate = sha256(header_prefix)
+        _nonce_worker_stop = stop_event
 
     @staticmethod
-    def _process_nonce_batch(block_bytes: bytes, start: int, end: int) -> int | None:
+    def _process_nonce_batch(start: int, end: int) -> int | None:
         """
-        Worker function for validating block with a range of nonces.
+        Worker function for searching a valid proof nonce for a block header.
 
-        :param block_bytes: a serialized block
         :param start: the lowest value of tested nonces (inclusive)
         :param end: the highest value of tested nonces (exclusive)
         :return: a found nonce or None if no valid was found
         """
 
-        from core.block import GenesisBlock
+        from struct import Struct
+
+        from core.block.block import PROOF_TARGET
 
-        assert isinstance(block_bytes, bytes) and len(block_bytes) > 0, \
-            'Argument `block_bytes` has to be of type bytes.'
+        assert _nonce_worker_midstate is not None, \
+            'Worker process has to be initialized with _init_nonce_worker.'
         assert isinstance(start, int) and isinstance(end, int) and start < end, \
             'Arguments `start` and `end` have to be of type int and end > start.'
 
-        # Deserialize the block data
-        block = GenesisBlock.from_bytes_chain(block_bytes)
+        target = PROOF_TARGET
+        midstate = _nonce_worker_midstate
+        stop = _nonce_worker_stop
+        pack_nonce = Struct('>q').pack
 
-        # Iterate through assigned range of nonces
+        # Iterate through assigned range of nonces; each attempt copies the midstate and only
+        # feeds the 8 nonce bytes through the final compression. The stop event is polled
+        # every 4096 nonces so the batch bails out quickly once another worker succeeded
         for nonce in range(start, end):
-            block.nonce = nonce
+            if (nonce & 0xFFF) == 0 and stop is not None and stop.is_set():
+                return None
+
+            digest = midstate.copy()
+            digest.update(pack_nonce(nonce))
 
-            # Check block validity
-            if block.valid_proof():
+            if digest.digest() < target:
                 return nonce
@@ -14,13 +14,16 @@ class SupportsFromBytes(Protocol):
 
 T = TypeVar('T', bound=SupportsFromBytes)
 
+# Precompiled array length prefix format; skips format-string parsing on every call
+ARRAY_LEN_STRUCT = struct.Struct('>H')
+
 
 class BytesHelper:
     @staticmethod
     @contextlib.contextmanager
-    def load_safe(b: bytes) -> None:
-        assert isinstance(b, bytes), \
-            'Argument `b` has to be of type bytes.'
+    def load_safe(b: bytes | memoryview) -> None:
+        assert isinstance(b, (bytes, memoryview)), \
+            'Argument `b` has to be of type bytes or memoryview.'
 
         try:
             yield
@@ -28,7 +31,7 @@ class BytesHelper:
             raise ValueError('Could not load valid data from provided byte sequence.')
 
     @staticmethod
-    def load_raw_data(b: bytes, size: int) -> Tuple[bytes, bytes]:
+    def load_raw_data(b: bytes | memoryview, size: int) -> Tuple[bytes | memoryview, bytes]:
         """
         Safely load raw bytes from provided byte sequence.
 
@@ -37,18 +40,19 @@ class BytesHelper:
         :return: a tuple of remaining bytes and the loaded bytes
         """
 
-        assert isinstance(b, bytes), \
-            'Argument `b` has to be of type bytes.'
+        assert isinstance(b, (bytes, memoryview)), \
+            'Argument `b` has to be of type bytes or memoryview.'
         assert isinstance(size, int) and size > 0, \
             'Argument `size` has to be of type int greater than zero.'
 
         if len(b) < size:
             raise ValueError('Could not load required length of raw data from provided byte sequence.')
 
-        return b[size:], b[:size]
+        # The loaded field is materialized as bytes; slicing the tail of a memoryview stays zero-copy
+        return b[size:], bytes(b[:size])
 
     @staticmethod
-    def to_array(b: bytes, cls: Type[T]) -> Tuple[bytes, Tuple[T]]:
+    def to_array(b: bytes | memoryview, cls: Type[T]) -> Tuple[bytes | memoryview, Tuple[T]]:
         """
         Convert provided bytes to array of provided objects.
 
@@ -57,17 +61,22 @@ class BytesHelper:
         :return: a tuple of remaining bytes and a tuple of deserialized classes
         """
 
-        assert isinstance(b, bytes), \
-            'Argument `b` has to be of type bytes.'
+        assert isinstance(b, (bytes, memoryview)), \
+            'Argument `b` has to be of type bytes or memoryview.'
         assert isinstance(cls, SupportsFromBytes), \
             'Argument `cls` has to be an object[SupportsFromBytes].'
 
         # Read bytes and unpack them to get array length, then delete the read bytes
         try:
-            b, array_len = b[2:], struct.unpack('>H', b[:2])[0]
+            array_len, b = ARRAY_LEN_STRUCT.unpack_from(b)[0], b[2:]
         except struct.error:
             raise ValueError('Argument `b` is not deserializable as an array.')
 
+        # Reject a declared length that cannot possibly fit into the remaining bytes before
+        # spending any work on deserializing items from a bloated or truncated payload
+        if array_len > len(b):
+            raise ValueError('Declared array length exceeds the remaining byte sequence.')
+
         # Load items from unread bytes and delete the read bytes on every iteration
         items: List[T] = list()
 
@@ -89,15 +98,8 @@ class BytesHelper:
         assert all(isinstance(cls, SupportsBytes) for cls in array), \
             'Argument `array` has to be an iterable of object[SupportsBytes].'
 
-        # Serialize every item and join them together forming one long bytes object
-        array_len = 0
-        items = b''
-
-        for item in array:
-            array_len += 1
-            items += bytes(item)
-
-        # Serialize the array length
-        array_len = struct.pack('>H', array_len)
+        # Serialize every item into a list and join once; repeated bytes concatenation would
+        # reallocate the accumulated buffer on every item
+        items = [bytes(item) for item in array]
 
-        return array_len + items
+        return ARRAY_LEN_STRUCT.pack(len(items)) + b''.join(items)
@@ -22,13 +22,33 @@ class HashHelper:
         assert len(branches) >= 0, \
             'Argument `leaves` has to have at least one item.'
 
-        # Loop until there is only the root left
-        while len(branches) > 1:
-            # If the length of branches is odd, add empty byte sequence to the array with no influence to the hash
-            if (len(branches) % 2) != 0:
-                branches.append(b'')
-
-            # Create sequential pairs from the branches and save the digest of their hash
-            branches = [sha256(a + b).digest() for a, b in zip(branches[0::2], branches[1::2])]
+        # Bind the constructor locally to keep the reduction loop free of global lookups
+        _sha256 = sha256
+
+        # Loop until there is only the root left, reducing each level in place instead of
+        # allocating a fresh list per level
+        size = len(branches)
+
+        while size > 1:
+            # If the length of the level is odd, add empty byte sequence with no influence to the hash
+            if (size % 2) != 0:
+                if size == len(branches):
+                    branches.append(b'')
+                else:
+                    branches[size] = b''
+
+                size += 1
+
+            # Create sequential pairs from the branches and write the digests back into the list head
+            # Feeding both halves through update() avoids allocating the concatenated 64-byte message
+            write = 0
+
+            for i in range(0, size, 2):
+                digest = _sha256(branches[i])
+                digest.update(branches[i + 1])
+                branches[write] = digest.digest()
+                write += 1
+
+            size = write
 
         return branches[0]
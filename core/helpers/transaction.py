@@ -1,8 +1,13 @@
+from __future__ import annotations
+
 import json
+import mmap
+import os
 from contextlib import suppress
-from typing import Set, Iterable, List, Dict
+from typing import Set, Iterable, List, Dict, TYPE_CHECKING
 
-from core.transaction import Transaction
+if TYPE_CHECKING:
+    from core.transaction import Transaction
 
 
 class TransactionHelper:
@@ -14,21 +19,43 @@ class TransactionHelper:
         :return: a set of waiting transactions
         """
 
-        # Load binary data from mempool
+        from core.transaction import Transaction
+
+        # Map the mempool file instead of reading it into a bytes object, so pages are
+        # faulted in on demand and nothing is copied up front
         try:
             with open('data/mempool.bin', 'rb') as file:
-                b = file.read()
+                try:
+                    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Mapping an empty file is not allowed
+                    return set()
         except FileNotFoundError:
             return set()
 
-        # Deserialize transactions from raw binary data
-        transactions = set()
+        # Deserialize transactions from the mapping through a zero-copy cursor,
+        # collecting into a list and deduplicating with a single set() pass at the end
+        b = memoryview(mapped)
+        transactions = []
+
+        try:
+            while len(b) > 0:
+                b, transaction = Transaction.from_bytes(b)
+                transactions.append(transaction)
+        except ValueError as error:
+            # The in-flight traceback keeps parser frames (and their views into the mapping)
+            # alive, so closing the mapping here would fail with a BufferError masking the
+            # real problem; release the cursor and re-raise a fresh error instead, letting
+            # refcounting close the mapping once the old traceback is dropped
+            b.release()
+
+            raise ValueError(*error.args) from None
 
-        while len(b) > 0:
-            b, transaction = Transaction.from_bytes(b)
-            transactions.add(transaction)
+        # The mapping cannot close while views into it are alive
+        b.release()
+        mapped.close()
 
-        return transactions
+        return set(transactions)
 
     @staticmethod
     def save_transaction(transaction: Transaction) -> None:
@@ -38,6 +65,8 @@ class TransactionHelper:
         :param transaction: the transaction to be saved
         """
 
+        from core.transaction import Transaction
+
         assert isinstance(transaction, Transaction), \
             'Transaction has to be an instance of Transaction.'
 
@@ -53,18 +82,22 @@ class TransactionHelper:
         :param transactions: an iterable of transactions
         """
 
+        from core.transaction import Transaction
+
         try:
-            # Serialize all provided transactions to bytes
-            data: List[bytes] = list(bytes(tx) for tx in transactions)
+            # Convert iterable to list
+            transactions = list(iter(transactions))
         except TypeError:
             raise TypeError('Argument `transactions` has to be an iterable of Transaction.')
 
         assert all(isinstance(transaction, Transaction) for transaction in transactions), \
             'Argument `transactions` has to be an iterable of Transaction.'
 
-        # Append serialized transactions to the mempool
+        # Write serialized transactions one by one so the file's own write buffer batches
+        # the I/O without first materializing the whole mempool as a single bytes object
         with open('data/mempool.bin', 'wb') as file:
-            file.write(b''.join(data))
+            for transaction in transactions:
+                file.write(bytes(transaction))
 
     @staticmethod
     def export_transaction(transaction: Transaction) -> None:
@@ -74,24 +107,33 @@ class TransactionHelper:
         :param transaction: the transaction to be exported
         """
 
+        from core.transaction import Transaction
+
         assert isinstance(transaction, Transaction), \
             'Transaction has to be an instance of Transaction.'
 
-        # Load serialized transactions from mempool
-        # Two different calls of open() are needed due to json.load not properly working with mode w+
-        data = list()
+        payload = json.dumps(transaction.json(), separators=(',', ':')).encode()
 
-        with suppress(FileNotFoundError), \
-                suppress(json.decoder.JSONDecodeError), \
-                open('data/mempool.json', 'r') as file:
-            data = json.load(file)
+        # Append in place by overwriting the array's closing bracket, so the export cost stays
+        # constant instead of re-reading and re-writing the whole file per transaction
+        with suppress(FileNotFoundError, ValueError):
+            with open('data/mempool.json', 'r+b') as file:
+                size = file.seek(0, os.SEEK_END)
+                file.seek(max(size - 1, 0))
 
-        # Append serialized transaction to the mempool
-        data.append(transaction.json())
+                if size < 2 or file.read(1) != b']':
+                    raise ValueError('Export is not a JSON array.')
 
-        with open('data/mempool.json', 'w') as file:
-            # Save the transactions
-            json.dump(data, file)
+                # Overwrite the closing bracket with the new element (preceded by a comma
+                # unless the array was empty) and a fresh closing bracket
+                file.seek(size - 1)
+                file.write((payload if size == 2 else b',' + payload) + b']')
+
+                return
+
+        # Missing or corrupted export; start a fresh array with just this transaction
+        with open('data/mempool.json', 'wb') as file:
+            file.write(b'[' + payload + b']')
 
     @staticmethod
     def export_transactions(transactions: Iterable[Transaction]) -> None:
@@ -101,9 +143,11 @@ class TransactionHelper:
         :param transactions: an iterable of transactions
         """
 
+        from core.transaction import Transaction
+
         try:
             # Serialize all provided transactions to JSON
-            data: List[Dict] = list(tx.json() for tx in transactions)
+            data: List[Dict] = [tx.json() for tx in transactions]
         except TypeError:
             raise TypeError('Argument `transactions` has to be an iterable of Transaction.')
 
@@ -111,9 +155,9 @@ class TransactionHelper:
         assert all(isinstance(transaction, Transaction) for transaction in transactions), \
             'Argument `transactions` has to be an iterable of Transaction.'
 
-        # Save the exported array
+        # Save the exported array; compact separators skip the space after every delimiter
         with open('data/mempool.json', 'w') as file:
-            json.dump(data, file)
+            json.dump(data, file, separators=(',', ':'))
 
     @staticmethod
     def remove_transactions(transactions: Iterable[Transaction]) -> None:
@@ -123,12 +167,12 @@ class TransactionHelper:
         :param transactions: the transactions to be removed
         """
 
-        # Load transactions from mempool
-        saved_transactions = TransactionHelper.load_transactions()
+        from core.transaction import Transaction
 
         try:
-            # Convert iterable to list
-            transactions = list(iter(transactions))
+            # Convert iterable to a set for constant-time membership checks; a list would make the
+            # filter below rescan (and re-compare) every removed transaction per saved transaction
+            transactions = set(iter(transactions))
         except TypeError:
             raise TypeError('Argument `transactions` has to be an iterable of object[Transaction].')
 
@@ -136,8 +180,16 @@ class TransactionHelper:
         assert all(isinstance(tx, Transaction) for tx in transactions), \
             'Argument `transactions` has to be an iterable of object[Transaction].'
 
-        # Remove provided transactions from loaded transactions
-        saved_transactions = list(filter(lambda tx: tx not in transactions, saved_transactions))
+        # Nothing to remove, so the mempool round-trip can be skipped entirely
+        if len(transactions) == 0:
+            return
+
+        # Load transactions from mempool
+        saved_transactions = TransactionHelper.load_transactions()
+
+        # Remove provided transactions from loaded transactions; the comprehension skips the
+        # per-item lambda dispatch a filter() would pay
+        saved_transactions = [tx for tx in saved_transactions if tx not in transactions]
 
         # Overwrite mempool with new transactions
         TransactionHelper.save_transactions(saved_transactions)
@@ -3,15 +3,22 @@ from __future__ import annotations
 import struct
 from typing import Tuple, TYPE_CHECKING, Sequence
 
-from .transaction import Transaction
+from core.helpers.bytes import BytesHelper
+from .transaction import Transaction, TIMESTAMP_STRUCT
 from .transaction_output import TransactionOutput
 
 if TYPE_CHECKING:
     from core.block import Block
-    from core.helpers.bytes import BytesHelper
 
 
 class CoinbaseTransaction(Transaction):
+    # All attributes live in Transaction's slots
+    __slots__ = ()
+
+    # Serialized empty array (equal to BytesHelper.from_array(())), precomputed once; a coinbase
+    # transaction never has inputs and is not signed, so both array fields serialize to this constant
+    _EMPTY_ARRAY_BYTES = struct.pack('>H', 0)
+
     def __init__(self, address: bytes):
         """
         Create a coinbase transaction that awards reward to specified address.
@@ -21,6 +28,28 @@ class CoinbaseTransaction(Transaction):
 
         super().__init__([], [TransactionOutput(address, 10)])
 
+    def __bytes__(self):
+        # Fall back to the generic serializer in the (unexpected) case of a signed coinbase
+        if len(self.signatures) > 0:
+            return super().__bytes__()
+
+        cache = self._bytes_cache
+
+        if cache is not None and cache[0] == self.timestamp:
+            return cache[2]
+
+        # The input and signature arrays are always empty, so only the timestamp and the
+        # single-output array have to be serialized
+        serialized = b''.join([
+            TIMESTAMP_STRUCT.pack(self.timestamp),
+            self._EMPTY_ARRAY_BYTES,
+            BytesHelper.from_array(self.outputs),
+            self._EMPTY_ARRAY_BYTES,
+        ])
+        self._bytes_cache = (self.timestamp, 0, serialized)
+
+        return serialized
+
     def valid(self, latest_block: Block | None, additional_transactions: Sequence[Transaction] = ()) -> bool:
         """
         Check if this transaction is valid in blockchain defined by it's latest block.
@@ -50,9 +79,11 @@ class CoinbaseTransaction(Transaction):
 
         from . import TransactionInput, TransactionSignature
 
+        source = b
+
         with BytesHelper.load_safe(b):
             # Load transaction properties
-            b, timestamp = b[8:], struct.unpack('>q', b[:8])
+            timestamp, b = TIMESTAMP_STRUCT.unpack_from(b)[0], b[8:]
             b, inputs = BytesHelper.to_array(b, TransactionInput)
 
             if len(inputs) != 0:
@@ -65,8 +96,9 @@ class CoinbaseTransaction(Transaction):
 
             b, signatures = BytesHelper.to_array(b, TransactionSignature)
 
-        # Create the transaction
+        # Create the transaction; seed the serialization cache with the exact consumed slice
         transaction = CoinbaseTransaction(outputs[0].address)
         transaction.timestamp = timestamp
+        transaction._bytes_cache = (timestamp, 0, bytes(source[:len(source) - len(b)]))
 
         return b, transaction
@@ -1,20 +1,29 @@
 from __future__ import annotations
 
 import struct
-from functools import reduce
 from hashlib import sha256
 from math import ceil
 from time import time
 from typing import TYPE_CHECKING, Sequence, List, Dict, Tuple, Any, Iterable
 
+from core.helpers.bytes import BytesHelper
+
 if TYPE_CHECKING:
     from core.block import Block
     from .transaction_input import TransactionInput
     from .transaction_output import TransactionOutput
     from .transaction_signature import TransactionSignature
 
+# Precompiled timestamp field format; skips format-string parsing on every call
+TIMESTAMP_STRUCT = struct.Struct('>q')
+
 
 class Transaction:
+    # Fixed attribute layout; transactions are the most numerous objects in a loaded chain,
+    # so skipping the per-instance __dict__ roughly halves their memory footprint
+    __slots__ = ('inputs', 'outputs', 'signatures', 'timestamp',
+                 '_id_cache', '_bytes_cache', '_signed_cache')
+
     def __init__(self, inputs: Sequence[TransactionInput], outputs: Sequence[TransactionOutput]):
         """
         Create a transaction from inputs and outputs.
@@ -27,11 +36,18 @@ class Transaction:
         from .transaction_input import TransactionInput
         from .transaction_output import TransactionOutput
 
-        assert (len(inputs) > 0 or isinstance(self, CoinbaseTransaction)) \
-               and all(isinstance(tx_input, TransactionInput) for tx_input in inputs), \
-            'Argument `inputs` has to be a sequence of TransactionInput instances with length > 0.'
-        assert all(isinstance(tx_output, TransactionOutput) for tx_output in outputs), \
-            'Argument `outputs` has to be a sequence of TransactionOutput instances.'
+        if __debug__:
+            # Validate the inputs and outputs in a single pass each; python -O skips the whole block
+            assert len(inputs) > 0 or isinstance(self, CoinbaseTransaction), \
+                'Argument `inputs` has to be a sequence of TransactionInput instances with length > 0.'
+
+            for tx_input in inputs:
+                assert isinstance(tx_input, TransactionInput), \
+                    'Argument `inputs` has to be a sequence of TransactionInput instances with length > 0.'
+
+            for tx_output in outputs:
+                assert isinstance(tx_output, TransactionOutput), \
+                    'Argument `outputs` has to be a sequence of TransactionOutput instances.'
 
         self.inputs: Tuple[TransactionInput] = tuple(inputs)
         self.outputs: Tuple[TransactionOutput] = tuple(outputs)
@@ -39,24 +55,54 @@ class Transaction:
 
         self.timestamp = ceil(time() * 1e3)
 
+        # Memoized ID and serialization, each stored with the (timestamp, signature count) pair they
+        # were computed for; inputs and outputs are immutable, while signing or loading from bytes
+        # changes the pair
+        self._id_cache: Tuple[int, int, bytes] | None = None
+        self._bytes_cache: Tuple[int, int, bytes] | None = None
+
+        # Memoized set of signer addresses stored with the signature count it was derived from,
+        # so repeated validations skip re-deriving every signer's address
+        self._signed_cache: Tuple[int, frozenset] | None = None
+
     def __bytes__(self):
-        from core.helpers import BytesHelper
+        cache = self._bytes_cache
 
-        return b''.join([
-            struct.pack('>q', self.timestamp),
+        if cache is not None and cache[0] == self.timestamp and cache[1] == len(self.signatures):
+            return cache[2]
+
+        serialized = b''.join([
+            TIMESTAMP_STRUCT.pack(self.timestamp),
             BytesHelper.from_array(self.inputs),
             BytesHelper.from_array(self.outputs),
             BytesHelper.from_array(self.signatures),
         ])
+        self._bytes_cache = (self.timestamp, len(self.signatures), serialized)
+
+        return serialized
 
     def __eq__(self, other: Any):
+        # Shared instances compare by identity without serializing either side
+        if self is other:
+            return True
+
         return bytes(other) == self.__bytes__()
 
     def __hash__(self):
-        return hash(self.__bytes__())
+        # Hashing the memoized 32-byte ID instead of the full serialization keeps this cheap
+        # for set/dict use while staying consistent with the serialization-based __eq__
+        return hash(self.id())
 
     def id(self) -> bytes:
-        return sha256(self.__bytes__()).digest()
+        cache = self._id_cache
+
+        if cache is not None and cache[0] == self.timestamp and cache[1] == len(self.signatures):
+            return cache[2]
+
+        transaction_id = sha256(self.__bytes__()).digest()
+        self._id_cache = (self.timestamp, len(self.signatures), transaction_id)
+
+        return transaction_id
 
     def json(self) -> Dict[str, Any]:
         """
@@ -108,17 +154,21 @@ class Transaction:
             if isinstance(latest_block, Block) else {}
 
         # Check if spending only unspent outpoints and count total available amount
+        # pop() removes the consumed outpoint so a duplicate input cannot count it twice,
+        # without routing the missing-outpoint case through exception handling
         total_available = 0
 
         for tx_input in self.inputs:
-            try:
-                total_available += unspent_outpoints[tx_input.outpoint].amount
-                del unspent_outpoints[tx_input.outpoint]
-            except KeyError:
+            tx_output = unspent_outpoints.pop(tx_input.outpoint, None)
+
+            if tx_output is None:
                 return False
 
-        # Calculate total spent amount
-        total_spent = reduce(lambda acc, curr: acc + curr.amount, self.outputs, 0)
+            total_available += tx_output.amount
+
+        # Calculate total spent amount; sum() runs the accumulation in C instead of
+        # dispatching a lambda per output
+        total_spent = sum(tx_output.amount for tx_output in self.outputs)
 
         # Check if spent amount is not greater than available amount and that all inputs are signed
         return total_available >= total_spent and self._signed(latest_block)
@@ -138,8 +188,15 @@ class Transaction:
         # Get transactions
         transactions = latest_block.expand_transactions() if isinstance(latest_block, Block) else {}
 
-        # Get signed addresses
-        signed_addresses = list(signature.wallet.address() for signature in self.signatures)
+        # Get signed addresses as a set for constant-time membership checks; the set is cached
+        # against the signature count, so only a new signature forces re-derivation
+        cache = self._signed_cache
+
+        if cache is not None and cache[0] == len(self.signatures):
+            signed_addresses = cache[1]
+        else:
+            signed_addresses = frozenset(signature.wallet.address() for signature in self.signatures)
+            self._signed_cache = (len(self.signatures), signed_addresses)
 
         # Check if all signed
         for tx_input in self.inputs:
@@ -163,11 +220,12 @@ class Transaction:
         from .transaction_output import TransactionOutput
         from .transaction_signature import TransactionSignature
         from . import CoinbaseTransaction
-        from core.helpers import BytesHelper
+
+        source = b
 
         with BytesHelper.load_safe(b):
             # Load transaction properties
-            b, timestamp = b[8:], struct.unpack('>q', b[:8])[0]
+            timestamp, b = TIMESTAMP_STRUCT.unpack_from(b)[0], b[8:]
             b, inputs = BytesHelper.to_array(b, TransactionInput)
             b, outputs = BytesHelper.to_array(b, TransactionOutput)
             b, signatures = BytesHelper.to_array(b, TransactionSignature)
@@ -177,6 +235,11 @@ class Transaction:
         transaction.signatures = signatures
         transaction.timestamp = timestamp
 
+        # Seed the serialization cache with the exact consumed slice, so writing the
+        # transaction back out (e.g. the mempool rewrite in remove_transactions) copies
+        # these bytes instead of re-encoding every field
+        transaction._bytes_cache = (timestamp, len(signatures), bytes(source[:len(source) - len(b)]))
+
         return b, transaction
 
     @staticmethod
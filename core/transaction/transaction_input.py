@@ -6,6 +6,10 @@ from .transaction_outpoint import TransactionOutpoint
 
 
 class TransactionInput:
+    # Fixed attribute layout; inputs are created in bulk during deserialization, so dropping
+    # the per-instance __dict__ roughly halves their memory footprint
+    __slots__ = ('outpoint', '_bytes_cache')
+
     def __init__(self, outpoint: TransactionOutpoint):
         """
         Create a transaction input referencing a transaction outpoint.
@@ -18,14 +22,30 @@ class TransactionInput:
 
         self.outpoint = outpoint
 
+        # Memoized serialization; inputs are immutable, so the cache never invalidates
+        self._bytes_cache = None
+
     def __bytes__(self):
-        return bytes(self.outpoint)
+        serialized = self._bytes_cache
+
+        if serialized is None:
+            serialized = bytes(self.outpoint)
+            self._bytes_cache = serialized
+
+        return serialized
 
     def __eq__(self, other: Any):
+        # Interned/shared instances compare by identity without serializing either side
+        if self is other:
+            return True
+
         return bytes(other) == self.__bytes__()
 
     def __hash__(self):
-        return hash(self.__bytes__())
+        # An input serializes to exactly its outpoint's bytes, so the two compare equal
+        # through __eq__; delegating keeps their hashes consistent while reusing the
+        # outpoint's precomputed value
+        return hash(self.outpoint)
 
     def json(self) -> Dict[str, Any]:
         """
@@ -47,9 +67,7 @@ class TransactionInput:
         :return: a tuple containing the remaining bytes and the input
         """
 
-        from ..helpers import BytesHelper
-
-        with BytesHelper.load_safe(b):
-            b, outpoint = TransactionOutpoint.from_bytes(b)
+        # The outpoint parser performs its own length validation, so no wrapper is needed
+        b, outpoint = TransactionOutpoint.from_bytes(b)
 
         return b, TransactionInput(outpoint)
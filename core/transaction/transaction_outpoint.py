@@ -1,10 +1,25 @@
 from __future__ import annotations
 
 import struct
+import weakref
 from typing import Dict, Any, Tuple
 
+# Precompiled layout of the 34-byte outpoint (transaction ID, output index); packing both
+# fields in one call also skips the intermediate concatenation
+OUTPOINT_STRUCT = struct.Struct('>32sH')
+
+# Intern table for deserialized outpoints; the same outpoint recurs across UTXO lookups and
+# blocks, so sharing one instance (and its cached serialization) per outpoint cuts allocations.
+# Weak values let unreferenced outpoints disappear with the objects that held them
+_interned_outpoints: 'weakref.WeakValueDictionary[bytes, TransactionOutpoint]' = weakref.WeakValueDictionary()
+
 
 class TransactionOutpoint:
+    # Fixed attribute layout; outpoints are created in bulk during deserialization and
+    # indexing, so dropping the per-instance __dict__ roughly halves their memory footprint.
+    # The __weakref__ slot keeps the interning table's weak references working
+    __slots__ = ('transaction_id', 'output_index', '_bytes_cache', '_hash_cache', '__weakref__')
+
     def __init__(self, transaction_id: bytes, output_index: int):
         """
         Create representation of transaction outpoint consisting of transaction and specific output of that transaction.
@@ -21,14 +36,29 @@ class TransactionOutpoint:
         self.transaction_id = transaction_id
         self.output_index = output_index
 
+        # Eager serialization; outpoints are immutable and every outpoint ends up serialized
+        # (UTXO keys, equality, persistence), so packing once here keeps __bytes__ a
+        # plain attribute read
+        self._bytes_cache = OUTPOINT_STRUCT.pack(transaction_id, output_index)
+
+        # Precomputed hash; the transaction ID is already a SHA-256 digest, so its first
+        # 8 bytes mixed with the index distribute as well as hashing the full serialization
+        self._hash_cache = int.from_bytes(transaction_id[:8], 'big') ^ output_index
+
     def __bytes__(self):
-        return self.transaction_id + struct.pack('>H', self.output_index)
+        return self._bytes_cache
 
     def __eq__(self, other: Any):
+        # Interned/shared instances compare by identity without serializing either side
+        if self is other:
+            return True
+
         return bytes(other) == self.__bytes__()
 
     def __hash__(self):
-        return hash(self.__bytes__())
+        # Outpoints are the hottest dict keys in the application (UTXO sets); returning the
+        # precomputed integer skips re-hashing 34 bytes on every lookup
+        return self._hash_cache
 
     def json(self) -> Dict[str, Any]:
         """
@@ -51,10 +81,21 @@ class TransactionOutpoint:
         :return: a tuple containing the remaining bytes and the outpoint
         """
 
-        from core.helpers import BytesHelper
+        # A single length check replaces the load_safe context manager; the outpoint has a
+        # fixed 34-byte layout, so nothing else can fail while parsing
+        if len(b) < 34:
+            raise ValueError('Could not load valid data from provided byte sequence.')
+
+        transaction_id, output_index = OUTPOINT_STRUCT.unpack_from(b)
+        b = b[34:]
+
+        # Share one instance per distinct outpoint
+        outpoint = TransactionOutpoint(transaction_id, output_index)
+        interned = _interned_outpoints.get(bytes(outpoint))
+
+        if interned is not None:
+            return b, interned
 
-        with BytesHelper.load_safe(b):
-            b, transaction_id = BytesHelper.load_raw_data(b, 32)
-            b, output_index = b[2:], struct.unpack('>H', b[:2])[0]
+        _interned_outpoints[bytes(outpoint)] = outpoint
 
-        return b, TransactionOutpoint(transaction_id, output_index)
+        return b, outpoint
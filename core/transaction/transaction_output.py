@@ -3,8 +3,20 @@ from __future__ import annotations
 import struct
 from typing import Dict, Any, Tuple
 
+# Precompiled layout of the 12-byte output (address, amount); packing both fields in one
+# call also skips the intermediate concatenation
+OUTPUT_STRUCT = struct.Struct('>8sf')
+
+# Intern table for deserialized addresses; the same few addresses repeat across the whole chain,
+# so sharing one bytes object per address keeps dict lookups on the identity fast path
+_interned_addresses: Dict[bytes, bytes] = {}
+
 
 class TransactionOutput:
+    # Fixed attribute layout; outputs are created in bulk during deserialization, so dropping
+    # the per-instance __dict__ roughly halves their memory footprint
+    __slots__ = ('address', 'amount', '_bytes_cache')
+
     def __init__(self, address: bytes, amount: int | float):
         """
         Create a transaction output pointing to an address with an amount.
@@ -21,10 +33,19 @@ class TransactionOutput:
         self.address = address
         self.amount = float(amount)
 
+        # Eager serialization; outputs are immutable and every output ends up serialized
+        # (ID hashing, equality, persistence), so packing once here keeps __bytes__ a
+        # plain attribute read
+        self._bytes_cache = OUTPUT_STRUCT.pack(address, self.amount)
+
     def __bytes__(self):
-        return self.address + struct.pack('>f', self.amount)
+        return self._bytes_cache
 
     def __eq__(self, other: Any):
+        # Interned/shared instances compare by identity without serializing either side
+        if self is other:
+            return True
+
         return bytes(other) == self.__bytes__()
 
     def __hash__(self):
@@ -51,10 +72,14 @@ class TransactionOutput:
         :return: a tuple containing the remaining bytes and the output
         """
 
-        from core.helpers import BytesHelper
+        # A single length check replaces the load_safe context manager; the output has a
+        # fixed 12-byte layout, so nothing else can fail while parsing
+        if len(b) < 12:
+            raise ValueError('Could not load valid data from provided byte sequence.')
+
+        address, amount = OUTPUT_STRUCT.unpack_from(b)
+        b = b[12:]
 
-        with BytesHelper.load_safe(b):
-            b, address = BytesHelper.load_raw_data(b, 8)
-            b, amount = b[4:], struct.unpack('>f', b[:4])[0]
+        address = _interned_addresses.setdefault(address, address)
 
         return b, TransactionOutput(address, amount)
